@@ -0,0 +1,57 @@
+import argparse
+
+
+def record(args: argparse.Namespace) -> None:
+    from logger.src import recorder
+
+    try:
+        recorder.record(
+            args.host,
+            args.port,
+            args.stream_port,
+            args.output,
+            args.rate,
+            args.append,
+        )
+    except FileExistsError as err:
+        raise SystemExit(f"{err}; record without --append to replace it")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m logger", description="KSP telemetry logger"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser(
+        "record", help="record telemetry of the active vessel to csv"
+    )
+    record_parser.add_argument(
+        "--host", default="localhost", help="kRPC server address"
+    )
+    record_parser.add_argument("--port", type=int, default=1000, help="kRPC rpc port")
+    record_parser.add_argument(
+        "--stream-port", type=int, default=1001, help="kRPC stream port"
+    )
+    record_parser.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help="maximum samples per second (0 means as fast as possible)",
+    )
+    record_parser.add_argument(
+        "-o", "--output", default="out.csv", help="csv file to write"
+    )
+    record_parser.add_argument(
+        "--append",
+        action="store_true",
+        help="continue the output file instead of replacing it (reconnect mid-mission)",
+    )
+    record_parser.set_defaults(handler=record)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
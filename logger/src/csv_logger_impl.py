@@ -1,4 +1,5 @@
-import pandas
+import csv
+import os
 from typing import Self
 
 
@@ -12,38 +13,110 @@ class CsvLogger(LoggerInterface):
 
     _columns: dict[str, list[float]] = {}
     _filename: str = None
+    _flushed_rows: int = 0
+    _append: bool = False
     _instance: Self = None
 
-    def __init__(self, filename: str = "out.csv"):
+    def __init__(self, filename: str = "out.csv", append: bool = False):
         """
         Public constructor
 
         :param filename: name of the file to write
+        :param append: continue existing file with the same columns instead of replacing it
         """
         self._filename = filename
+        self._append = append
 
-    def _clean_data(self) -> None:
+    def _can_append(self) -> bool:
         """
-        Ensure that all column arrays have the same size by appending zeroes at the end
+        Check, whether existing file has the same columns, so that new rows can be appended to it
 
-        :return: None
+        :return: True if the file exists and has matching header, False if there is no data in it
+        """
+        try:
+            with open(self._filename, "rb+") as f:
+                header = f.readline().decode().rstrip("\r\n")
+                if header and header != ",".join(self._columns.keys()):
+                    raise FileExistsError(
+                        f"{self._filename} has columns {header}, "
+                        f"which differ from {','.join(self._columns.keys())}"
+                    )
+                # Previous run could be interrupted in the middle of the row
+                data_end = self._last_line_end(f) if header else 0
+                f.truncate(data_end)
+        except FileNotFoundError:
+            return False
+
+        if not data_end:
+            # Not even the header was written completely
+            return False
+
+        print(f"Continuing {self._filename}")
+        return True
+
+    @staticmethod
+    def _last_line_end(f, chunk_size: int = 4096) -> int:
         """
-        max_length = max([len(self._columns[key]) for key in self._columns.keys()])
+        Find position right after the last newline of the binary file
 
-        for key in self._columns.keys():
-            self._columns[key] += [0] * (max_length - len(self._columns[key]))
+        :param f: File opened in binary mode
+        :param chunk_size: Amount of bytes read at once from the end of the file
+        :return: Position after the last newline, or 0 if there is none
+        """
+        end = f.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - chunk_size)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline != -1:
+                return start + newline + 1
+            end = start
 
-        return
+        return 0
 
     def dump(self):
         """
-        Write data to csv file
+        Write data, which was not written yet, to csv file
+
+        Incomplete trailing sample (e.g. interrupted between two log calls) is dropped.
+
+        :return: None
+        """
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Append completed rows, which were not written yet, to csv file
+
+        On the first write existing file is replaced, or continued if append is set.
 
         :return: None
         """
-        self._clean_data()
-        df = pandas.DataFrame.from_dict(self._columns)
-        df.to_csv(self._filename, index=False, mode="w")
+        if not self._columns:
+            return
+
+        completed_rows = min([len(column) for column in self._columns.values()])
+        if completed_rows <= self._flushed_rows:
+            return
+
+        write_header = not self._flushed_rows and (
+            not self._append or not self._can_append()
+        )
+        mode = "w" if write_header else "a"
+        with open(self._filename, mode, newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            if write_header:
+                writer.writerow(self._columns.keys())
+            writer.writerows(
+                zip(
+                    *[
+                        column[self._flushed_rows : completed_rows]
+                        for column in self._columns.values()
+                    ]
+                )
+            )
+
+        self._flushed_rows = completed_rows
 
     def log(self, variable_type: str, value: float) -> None:
         """
@@ -11,6 +11,14 @@ class LoggerInterface:
         """
         pass
 
+    def flush(self) -> None:
+        """
+        Write log content, which was not written yet
+
+        :return: None
+        """
+        pass
+
     def dump(self) -> None:
         """
         Dump log content
@@ -0,0 +1,60 @@
+import time
+
+from shared.krpc_client import FuelType
+from logger.src.csv_logger_impl import CsvLogger
+from logger.src.ksp_data_repository import KspDataRepository
+
+
+def record(
+    address: str = "localhost",
+    port: int = 1000,
+    stream_port: int = 1001,
+    filename: str = "out.csv",
+    rate: float = 0,
+    append: bool = False,
+) -> None:
+    """
+    Record telemetry of the active vessel until interrupted.
+
+    :param address: Ip address of the kRPC server
+    :param port: Port of the server
+    :param stream_port: Port for io stream
+    :param filename: Name of the csv file to write
+    :param rate: Maximum amount of samples per second (0 means as fast as possible)
+    :param append: Continue existing csv file (e.g. when reconnecting mid-mission)
+    :return: None
+    """
+    ksp_data_repository = KspDataRepository(address, port, stream_port)
+    logger = CsvLogger(filename, append)
+    period = 1 / rate if rate else 0
+    print("Started")
+    try:
+        while True:
+            started = time.monotonic()
+            current_time = ksp_data_repository.get_current_time()
+            logger.log("Time", current_time)
+            current_altitude = ksp_data_repository.get_current_altitude()
+            logger.log("Altitude", current_altitude)
+            current_pressure = ksp_data_repository.get_current_pressure()
+            logger.log("Pressure", current_pressure)
+            current_velocity = ksp_data_repository.get_current_velocity()
+            logger.log("Velocity", current_velocity)
+            current_solid_fuel_resource = ksp_data_repository.get_fuel_amount(
+                FuelType.SOLID_FUEL
+            )
+            logger.log("SolidFuel", current_solid_fuel_resource)
+            current_liquid_fuel_resource = ksp_data_repository.get_fuel_amount(
+                FuelType.LIQUID_FUEL
+            )
+            logger.log("LiquidFuel", current_liquid_fuel_resource)
+            current_temp = ksp_data_repository.get_current_temperature()
+
+            logger.log("Temperature", current_temp)
+            current_angle = ksp_data_repository.get_current_angle()
+            logger.log("Angle", current_angle)
+            logger.flush()
+            if period:
+                time.sleep(max(0.0, period - (time.monotonic() - started)))
+    except KeyboardInterrupt as err:
+        print(err)
+        logger.dump()
@@ -1,2 +0,0 @@
-if __name__ == "__main__":
-    pass
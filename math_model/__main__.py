@@ -0,0 +1,135 @@
+import argparse
+import importlib
+
+PHASES = (2, 3)
+
+
+def solve(args: argparse.Namespace) -> None:
+    for phase in args.phase:
+        solver = importlib.import_module(f"math_model.src.ode_solver_phase{phase}")
+        solver.solve(args.phase_ends, args.log)
+
+
+def sweep(args: argparse.Namespace) -> None:
+    import numpy as np
+
+    solver = importlib.import_module(f"math_model.src.ode_solver_phase{args.phase}")
+    start_time, u0, initial_mass = solver.read_initial_conditions(args.phase_ends)
+
+    print("Throttle, Time, Y, Vy")
+    for throttle in np.linspace(args.start, args.stop, args.steps):
+        try:
+            t, sol = solver.integrate(u0, initial_mass, throttle)
+            end = solver.find_end(sol)
+        except OverflowError:
+            # Trajectory left the domain of the atmosphere model
+            end = None
+        if end is None:
+            print(", ".join([str(throttle), "-", "-", "-"]))
+            continue
+        print(
+            ", ".join(
+                [
+                    str(throttle),
+                    str(t[end] + start_time),
+                    str(sol[end][0] - solver.Rd),
+                    str(sol[end][1]),
+                ]
+            )
+        )
+
+
+def plot(args: argparse.Namespace) -> None:
+    if args.live:
+        from math_model.src.live_graph import LiveGraph
+
+        graph = LiveGraph(
+            args.input, tuple(args.columns), args.time_column, args.max_points
+        )
+        try:
+            graph.wait_for_columns(args.interval)
+        except KeyError as err:
+            raise SystemExit(err.args[0])
+        graph.run(args.interval, args.html)
+        return
+
+    from math_model.src.graph_generator import GraphGenerator
+    from math_model.src.live_graph import CsvTail
+
+    tail = CsvTail(args.input)
+    rows = tail.read_rows()
+    if not rows:
+        raise SystemExit(f"No data in {args.input}")
+
+    try:
+        time_index, *indexes = tail.indexes([args.time_column, *args.columns])
+    except KeyError as err:
+        raise SystemExit(err.args[0])
+
+    for column, index in zip(args.columns, indexes):
+        GraphGenerator.create_graph(
+            f"{column} ({args.time_column})",
+            f"{args.time_column} (sec)",
+            column,
+            [row[time_index] for row in rows],
+            [row[index] for row in rows],
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m math_model", description="Descent math model"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = subparsers.add_parser(
+        "solve", help="solve descent phases, starting from the phase ends file"
+    )
+    solve_parser.add_argument(
+        "--phase",
+        type=int,
+        nargs="+",
+        choices=PHASES,
+        default=list(PHASES),
+        help="phases to solve in order",
+    )
+    solve_parser.add_argument("--phase-ends", default="phase_ends.txt")
+    solve_parser.add_argument("--log", default="log_model.txt")
+    solve_parser.set_defaults(handler=solve)
+
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="print end state of a phase for a range of throttle values"
+    )
+    sweep_parser.add_argument("--phase", type=int, choices=PHASES, default=2)
+    sweep_parser.add_argument("--start", type=float, default=0.1)
+    sweep_parser.add_argument("--stop", type=float, default=0.2)
+    sweep_parser.add_argument("--steps", type=int, default=11)
+    sweep_parser.add_argument("--phase-ends", default="phase_ends.txt")
+    sweep_parser.set_defaults(handler=sweep)
+
+    plot_parser = subparsers.add_parser("plot", help="plot telemetry csv")
+    plot_parser.add_argument("-i", "--input", default="out.csv")
+    plot_parser.add_argument(
+        "--columns",
+        nargs="+",
+        default=["Altitude", "Velocity", "Pressure", "Temperature"],
+    )
+    plot_parser.add_argument("--time-column", default="Time")
+    plot_parser.add_argument(
+        "--live", action="store_true", help="follow the file while the logger writes it"
+    )
+    plot_parser.add_argument(
+        "--interval", type=float, default=0.5, help="live update interval in seconds"
+    )
+    plot_parser.add_argument(
+        "--max-points", type=int, default=2000, help="live points per plot"
+    )
+    plot_parser.add_argument("--html", help="live html page to rewrite on updates")
+    plot_parser.set_defaults(handler=plot)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import hashlib
+import importlib.metadata
+import importlib.util
+import inspect
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from math_model.src.symbolic_model import SymbolicModel
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".model_cache"
+# Generated code depends on the generator, so its source is a part of the cache key
+GENERATOR_PATH = Path(__file__).resolve().parent / "symbolic_model.py"
+
+
+class CompiledModel:
+    """Generated numeric model, loaded from the disk cache and built with sympy only on a miss"""
+
+    def __init__(
+        self,
+        name: str,
+        builder: Callable[[], "SymbolicModel"],
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+    ):
+        """
+        Public constructor
+
+        :param name: Name of the model, used as a prefix of the generated module
+        :param builder: Function, which creates the SymbolicModel; it should import sympy itself
+        :param cache_dir: Directory, where the generated code is stored
+        """
+        self.name = name
+        self._builder = builder
+        self._cache_dir = Path(cache_dir)
+        self._module: ModuleType | None = None
+
+    @property
+    def hash(self) -> str:
+        """
+        Hash of the module defining the model, of the generator and of sympy version.
+
+        Computed from source files, so checking the cache does not need sympy.
+
+        :return: Hex digest of the model
+        """
+        digest = hashlib.sha256()
+        digest.update(importlib.metadata.version("sympy").encode())
+        digest.update(GENERATOR_PATH.read_bytes())
+        digest.update(Path(inspect.getfile(self._builder)).read_bytes())
+        digest.update(self._builder.__qualname__.encode())
+        return digest.hexdigest()[:16]
+
+    @property
+    def rhs(self) -> Callable[..., list[float]]:
+        """
+        Numeric right hand side with signature f(u, t, *parameters), as expected by odeint.
+
+        :return: Generated function
+        """
+        return self._load().rhs
+
+    @property
+    def jacobian(self) -> Callable[..., list[list[float]]]:
+        """
+        Numeric Jacobian with signature f(u, t, *parameters), usable as Dfun of odeint.
+
+        :return: Generated function
+        """
+        return self._load().jacobian
+
+    def arguments(self, **values: float) -> tuple[float, ...]:
+        """
+        Order parameter values the way generated functions expect them.
+
+        :param values: Values of all model parameters by name
+        :return: Tuple of parameter values
+        """
+        parameters = self._load().PARAMETERS
+        missing = [p for p in parameters if p not in values]
+        if missing:
+            raise KeyError(f"Missing parameters for model {self.name}: {missing}")
+
+        return tuple(values[p] for p in parameters)
+
+    def _load(self) -> ModuleType:
+        """
+        Load generated module from the cache, generating it on a miss.
+
+        :return: Generated module
+        """
+        if self._module is not None:
+            return self._module
+
+        path = self._cache_dir / f"{self.name}_{self.hash}.py"
+        if not path.exists():
+            source = self._builder().generate_source()
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(source)
+            os.replace(tmp_path, path)
+
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        self._module = module
+        return module
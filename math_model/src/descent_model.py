@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING
+
+from math_model.src.compiled_model import CompiledModel
+
+if TYPE_CHECKING:
+    from math_model.src.symbolic_model import SymbolicModel
+
+# Constants of Duna and the lander
+DUNA_CONSTANTS = {
+    "M": 43.05 * 1e-3,
+    "Rd": 3.2 * 1e5,
+    "p0": 6755,
+    "T0": 252,
+    "Md": 4.515427 * 1e21,
+    "alpha": 24.190682312 ** (2 / 3) * 1.1507,
+    "R": 8.31,
+    "G": 6.674 * 1e-11,
+    "max_thrust": 8 * 9.1032 * 1e3,
+    "fuel_rate": 1.13,
+}
+
+
+def create_descent_model() -> "SymbolicModel":
+    """
+    Create model of powered descent in Duna atmosphere.
+
+    State is (y, v), where y is the distance to the centre of Duna and v is the descent speed.
+
+    :return: Descent model, parametrized by throttle, initial mass and DUNA_CONSTANTS
+    """
+    import sympy
+
+    from math_model.src.symbolic_model import SymbolicModel
+
+    y, v, t = sympy.symbols("y v t")
+    throttle, m0 = sympy.symbols("throttle m0")
+    M, Rd, p0, T0, Md, alpha, R, G, max_thrust, fuel_rate = sympy.symbols(
+        list(DUNA_CONSTANTS.keys())
+    )
+
+    P = throttle * max_thrust
+    T = T0 - (y - Rd) * 0.0045
+    g = G * Md / y**2
+    p = p0 * sympy.exp(-M * g * (y - Rd) / (R * T))
+    ro = p * M / (R * T)
+    m = m0 - fuel_rate * t * throttle
+
+    dvdt = -(ro / 2) * (v**2) * alpha / m + g - P / m
+
+    return SymbolicModel(
+        name="descent",
+        state=[y, v],
+        time=t,
+        equations=[-v, dvdt],
+        parameters=[
+            throttle,
+            m0,
+            M,
+            Rd,
+            p0,
+            T0,
+            Md,
+            alpha,
+            R,
+            G,
+            max_thrust,
+            fuel_rate,
+        ],
+    )
+
+
+# Built with sympy only when the generated code is not cached yet
+DESCENT_MODEL = CompiledModel("descent", create_descent_model)
@@ -0,0 +1,374 @@
+import os
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+DEFAULT_COLUMNS = ("Altitude", "Velocity", "Pressure", "Temperature")
+
+
+class CsvTail:
+    """Reader, which returns only rows appended to csv file since the previous read"""
+
+    def __init__(self, filename: str):
+        """
+        Public constructor
+
+        :param filename: name of the file to tail
+        """
+        self._filename = filename
+        self._offset = 0
+        self._partial = ""
+        self.header: list[str] = []
+        self.restarts = 0
+        self.skipped = 0
+
+    def reset(self) -> None:
+        """
+        Start reading the file from the beginning.
+
+        :return: None
+        """
+        self._offset = 0
+        self._partial = ""
+        self.header = []
+
+    def read_header(self) -> list[str]:
+        """
+        Read the header, if nothing was read from the file yet and the header is written completely.
+
+        :return: Header, or empty list if it is not available yet
+        """
+        if self.header or self._offset:
+            return self.header
+
+        try:
+            with open(self._filename, "r", newline="") as f:
+                line = f.readline()
+                if line.endswith("\n"):
+                    self.header = line.strip().split(",")
+                    self._offset = f.tell()
+        except FileNotFoundError:
+            pass
+
+        return self.header
+
+    def read_rows(self) -> list[list[float]]:
+        """
+        Read rows, which were appended since the previous call.
+
+        If the file was truncated (e.g. rewritten by the logger), it is read from the beginning.
+        Malformed lines (wrong amount of fields or not numbers) are skipped and counted.
+
+        :return: List of complete new rows
+        """
+        try:
+            size = os.path.getsize(self._filename)
+        except FileNotFoundError:
+            return []
+
+        if size < self._offset:
+            self.reset()
+            self.restarts += 1
+        if size == self._offset:
+            return []
+
+        with open(self._filename, "r", newline="") as f:
+            f.seek(self._offset)
+            data = f.read()
+            self._offset = f.tell()
+
+        lines = (self._partial + data).split("\n")
+        self._partial = lines.pop()
+
+        if not self.header and lines:
+            self.header = lines.pop(0).strip().split(",")
+
+        rows = []
+        for line in lines:
+            values = line.split(",")
+            if len(values) != len(self.header):
+                self.skipped += 1
+                continue
+            try:
+                rows.append([float(value) for value in values])
+            except ValueError:
+                self.skipped += 1
+
+        return rows
+
+    def indexes(self, columns: list[str]) -> list[int]:
+        """
+        Find positions of the columns in the header.
+
+        :param columns: Column names
+        :return: Column indexes in the same order
+        """
+        missing = [column for column in columns if column not in self.header]
+        if missing:
+            raise KeyError(
+                f"Columns {missing} are not in {self._filename}, available: {self.header}"
+            )
+
+        return [self.header.index(column) for column in columns]
+
+
+class DecimatedSeries:
+    """Series, which keeps at most max_points points by halving its resolution when full"""
+
+    def __init__(self, max_points: int = 2000):
+        """
+        Public constructor
+
+        :param max_points: Maximum amount of stored points
+        """
+        self._max_points = max_points
+        self._stride = 1
+        self._skipped = 0
+        self._x = np.empty(max_points)
+        self._y = np.empty(max_points)
+        self._size = 0
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x[: self._size]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y[: self._size]
+
+    def append(self, x: float, y: float) -> None:
+        """
+        Add point, keeping only every stride-th one.
+
+        :param x: X value
+        :param y: Y value
+        :return: None
+        """
+        self._skipped += 1
+        if self._skipped < self._stride:
+            return
+        self._skipped = 0
+
+        if self._size == self._max_points:
+            half = self._size // 2
+            self._x[:half] = self._x[: self._size : 2][:half]
+            self._y[:half] = self._y[: self._size : 2][:half]
+            self._size = half
+            self._stride *= 2
+
+        self._x[self._size] = x
+        self._y[self._size] = y
+        self._size += 1
+
+
+class LiveGraph:
+    """Dashboard, which incrementally plots telemetry from the growing logger output"""
+
+    def __init__(
+        self,
+        filename: str = "out.csv",
+        columns: tuple[str, ...] = DEFAULT_COLUMNS,
+        time_column: str = "Time",
+        max_points: int = 2000,
+    ):
+        """
+        Public constructor
+
+        :param filename: Csv file written by the logger
+        :param columns: Columns to plot against time
+        :param time_column: Column with time values
+        :param max_points: Maximum amount of points drawn on each plot
+        """
+        self._tail = CsvTail(filename)
+        self._columns = columns
+        self._time_column = time_column
+        self._max_points = max_points
+        self._series = {column: DecimatedSeries(max_points) for column in columns}
+
+        self._figure, axes = plt.subplots(len(columns), 1, sharex=True, squeeze=False)
+        self._blit = self._figure.canvas.supports_blit
+        self._axes = {column: axes[i][0] for i, column in enumerate(columns)}
+        self._lines = {}
+        for column, ax in self._axes.items():
+            ax.set_ylabel(column)
+            ax.grid()
+            (self._lines[column],) = ax.plot([], [], animated=self._blit)
+        axes[-1][0].set_xlabel(f"{time_column} (sec)")
+        self._background = None
+        self._limits_stale = True
+        self._indexes: tuple[int, dict[str, int]] | None = None
+        if self._blit:
+            self._figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _draw_lines(self) -> None:
+        """
+        Draw animated lines over the current canvas content.
+
+        :return: None
+        """
+        for column, line in self._lines.items():
+            self._axes[column].draw_artist(line)
+
+    def _on_draw(self, event) -> None:
+        """
+        Recapture the background after any full redraw (resize, pan, zoom) and draw lines over it.
+
+        :param event: Matplotlib draw event
+        :return: None
+        """
+        canvas = self._figure.canvas
+        self._background = canvas.copy_from_bbox(self._figure.bbox)
+        self._draw_lines()
+
+    def _reset(self) -> None:
+        """
+        Drop all plotted data.
+
+        :return: None
+        """
+        self._series = {
+            column: DecimatedSeries(self._max_points) for column in self._columns
+        }
+        self._limits_stale = True
+        self._indexes = None
+
+    def _column_indexes(self) -> tuple[int, dict[str, int]]:
+        """
+        Find positions of the time and plotted columns in the csv header.
+
+        :return: Time column index and indexes of plotted columns by name
+        """
+        time_index, *column_indexes = self._tail.indexes(
+            [self._time_column, *self._columns]
+        )
+        return time_index, dict(zip(self._columns, column_indexes))
+
+    def wait_for_columns(self, interval: float = 0.5) -> None:
+        """
+        Wait until the csv header is written and check, that it has all plotted columns.
+
+        :param interval: Delay between checks in seconds
+        :return: None
+        """
+        while not self._tail.read_header():
+            time.sleep(interval)
+        self._indexes = self._column_indexes()
+
+    def _fits_limits(self, column: str) -> bool:
+        """
+        Check, whether series of the column is inside of the current axes limits.
+
+        :param column: Column name
+        :return: True if no rescale is needed
+        """
+        series = self._series[column]
+        if not len(series.x):
+            return True
+        x_min, x_max = self._axes[column].get_xlim()
+        y_min, y_max = self._axes[column].get_ylim()
+        return (
+            x_min <= series.x[0]
+            and series.x[-1] <= x_max
+            and y_min <= series.y.min()
+            and series.y.max() <= y_max
+        )
+
+    def _rescale(self) -> None:
+        """
+        Extend axes limits with headroom, so that full redraws stay rare.
+
+        :return: None
+        """
+        for column, ax in self._axes.items():
+            series = self._series[column]
+            if not len(series.x):
+                continue
+            x_min, x_max = series.x[0], series.x[-1]
+            y_min, y_max = series.y.min(), series.y.max()
+            x_span = max(x_max - x_min, 1.0)
+            y_span = max(y_max - y_min, abs(y_max) * 0.1, 1.0)
+            ax.set_xlim(x_min, x_max + x_span)
+            ax.set_ylim(y_min - y_span * 0.25, y_max + y_span * 0.25)
+
+    def update(self) -> int:
+        """
+        Read new rows and redraw the plots.
+
+        Only the lines are blitted unless new data goes out of the axes limits.
+        Without blitting support the canvas is redrawn when idle.
+
+        :return: Amount of new rows
+        """
+        restarts = self._tail.restarts
+        rows = self._tail.read_rows()
+        restarted = self._tail.restarts != restarts
+        if restarted:
+            # Old data is cleared from the plots even if no new rows came yet
+            self._reset()
+        elif not rows:
+            return 0
+
+        if rows:
+            if self._indexes is None:
+                self._indexes = self._column_indexes()
+            time_index, indexes = self._indexes
+            for row in rows:
+                for column, index in indexes.items():
+                    self._series[column].append(row[time_index], row[index])
+
+        for column, line in self._lines.items():
+            line.set_data(self._series[column].x, self._series[column].y)
+
+        canvas = self._figure.canvas
+        if self._limits_stale or not all(map(self._fits_limits, self._columns)):
+            self._rescale()
+            # Limits are kept stale until there is data to fit them to
+            self._limits_stale = not rows
+            if self._blit:
+                # Background and lines are drawn by _on_draw
+                canvas.draw()
+            else:
+                canvas.draw_idle()
+        elif self._blit and self._background is not None:
+            canvas.restore_region(self._background)
+            self._draw_lines()
+            canvas.blit(self._figure.bbox)
+        else:
+            canvas.draw_idle()
+        canvas.flush_events()
+
+        return len(rows)
+
+    def save_html(self, filename: str) -> None:
+        """
+        Save decimated plots as html page.
+
+        :param filename: Name of the html file
+        :return: None
+        """
+        import mpld3
+
+        for line in self._lines.values():
+            line.set_animated(False)
+        mpld3.save_html(self._figure, filename)
+        for line in self._lines.values():
+            line.set_animated(self._blit)
+
+    def run(self, interval: float = 0.5, html_filename: str = None) -> None:
+        """
+        Update the plots until the window is closed.
+
+        :param interval: Delay between updates in seconds
+        :param html_filename: If set, html page is rewritten after each update with new rows
+        :return: None
+        """
+        plt.show(block=False)
+        while plt.fignum_exists(self._figure.number):
+            if self.update() and html_filename is not None:
+                self.save_html(html_filename)
+            self._figure.canvas.start_event_loop(interval)
+
+
+if __name__ == "__main__":
+    LiveGraph().run()
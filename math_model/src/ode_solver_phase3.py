@@ -1,92 +1,128 @@
-import math
 import numpy as np
 from scipy.integrate import odeint
 
+from math_model.src.descent_model import DESCENT_MODEL, DUNA_CONSTANTS
 
-def dudt(u, t):
-    y, dydt = u
+Rd = DUNA_CONSTANTS["Rd"]
+beta = 0.13194
+sigma = 0.12165
+end_altitude = 0
 
-    P = sigma * (8 * 9.1032 * 1e3)
-    T = T0 - (y - Rd) * 0.0045
-    g = G * Md / y**2
-    p = p0 * math.e ** (-M * g * (y - Rd) / (R * T))
-    ro = p * M / (R * T)
-    m = m0 - 1.13 * t * sigma
 
-    dvdt = -(ro / 2) * (dydt**2) * alpha / m + g - P / m
+def read_initial_conditions(
+    phase_ends_filename: str = "phase_ends.txt",
+) -> tuple[float, list[float], float]:
+    """
+    Read state at the end of phase 2.
 
-    return [-dydt, dvdt]
+    :param phase_ends_filename: File with phase end states
+    :return: Start time, initial state vector and initial mass
+    """
+    with open(phase_ends_filename, "r+") as f:
+        phase_1_end = float(f.readline().split(", ")[0])
+        data = f.readline().split(", ")
+        phase_2_end = float(data[0])
+        y0 = float(data[1]) + Rd
+        vy0 = float(data[2])
 
+    m0 = 3.0257 * 1e3 - 1.13 * (phase_2_end - phase_1_end) * beta
+    return phase_2_end, [y0, vy0], m0
 
-Rd = 3.2 * 1e5
 
-# Начальные условия
-with open("phase_ends.txt", "r+") as f:
-    phase_1_end = float(f.readline().split(", ")[0])
-    data = f.readline().split(", ")
-    phase_2_end = float(data[0])
-    y0 = float(data[1]) + Rd
-    vy0 = float(data[2])
+def integrate(
+    u0: list[float], initial_mass: float, throttle: float = sigma
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Solve the descent ODE system for phase 3.
 
-beta = 0.13194
-sigma = 0.12165
-mf = 510 - 1.13 * (phase_2_end - phase_1_end) * beta
-M = 43.05 * 1e-3
-p0 = 6755
-T0 = 252
-Md = 4.515427 * 1e21
-Vship = 24.190682312 ** (2 / 3)
-CDship = 1.1507
-alpha = Vship * CDship
-R = 8.31
-G = 6.674 * 1e-11
-m0 = 3.0257 * 1e3 - 1.13 * (phase_2_end - phase_1_end) * beta
-
-# Вектор начальных условий
-u0 = [y0, vy0]
-
-# Интервал времени
-t = np.linspace(0, 217, 217000)
-
-# Решение системы ОДУ
-sol = odeint(dudt, u0, t)
-
-with open("log_model.txt", "a+") as f:
-    print("Time, Y, Vy (phase 3)", file=f)
-for i in range(len(sol)):
-    if not i % 100:
-        with open("log_model.txt", "a+") as f:
-            print(
-                ", ".join(
-                    [
-                        str(t[i] + phase_2_end),
-                        "-",
-                        "-",
-                        str(sol[i][0] - Rd),
-                        str(sol[i][1]),
-                    ]
-                ),
-                file=f,
-            )
-    if sol[i][0] - Rd <= 0:
-        with open("log_model.txt", "a+") as f:
-            print(
-                ", ".join(
-                    [
-                        str(t[i] + phase_2_end),
-                        "-",
-                        "-",
-                        str(sol[i][0] - Rd),
-                        str(sol[i][1]),
-                    ]
-                ),
-                file=f,
-            )
-        with open("phase_ends.txt", "a+") as f:
-            print(
-                ", ".join(
-                    [str(t[i] + phase_2_end), str(sol[i][0] - Rd), str(sol[i][1])]
-                ),
-                file=f,
-            )
-        break
+    :param u0: Initial state vector
+    :param initial_mass: Mass of the lander at the start of the phase
+    :param throttle: Engine throttle during the phase
+    :return: Time array and solution array
+    """
+    # Интервал времени
+    t = np.linspace(0, 217, 217000)
+
+    # Решение системы ОДУ
+    sol = odeint(
+        DESCENT_MODEL.rhs,
+        u0,
+        t,
+        args=DESCENT_MODEL.arguments(
+            throttle=throttle, m0=initial_mass, **DUNA_CONSTANTS
+        ),
+        Dfun=DESCENT_MODEL.jacobian,
+    )
+    return t, sol
+
+
+def find_end(sol: np.ndarray) -> int | None:
+    """
+    Find index, where phase 3 ends.
+
+    :param sol: Solution array
+    :return: Index of the first state below the end altitude, or None if it is not reached
+    """
+    below = np.nonzero(sol[:, 0] - Rd <= end_altitude)[0]
+    return int(below[0]) if len(below) else None
+
+
+def solve(
+    phase_ends_filename: str = "phase_ends.txt",
+    log_filename: str = "log_model.txt",
+    throttle: float = sigma,
+) -> None:
+    """
+    Solve phase 3, append the trajectory to the log and its end state to phase ends.
+
+    :param phase_ends_filename: File with phase end states
+    :param log_filename: File with model trajectory
+    :param throttle: Engine throttle during the phase
+    :return: None
+    """
+    phase_2_end, u0, initial_mass = read_initial_conditions(phase_ends_filename)
+    t, sol = integrate(u0, initial_mass, throttle)
+
+    with open(log_filename, "a+") as f:
+        print("Time, Y, Vy (phase 3)", file=f)
+    for i in range(len(sol)):
+        if not i % 100:
+            with open(log_filename, "a+") as f:
+                print(
+                    ", ".join(
+                        [
+                            str(t[i] + phase_2_end),
+                            "-",
+                            "-",
+                            str(sol[i][0] - Rd),
+                            str(sol[i][1]),
+                        ]
+                    ),
+                    file=f,
+                )
+        if sol[i][0] - Rd <= end_altitude:
+            with open(log_filename, "a+") as f:
+                print(
+                    ", ".join(
+                        [
+                            str(t[i] + phase_2_end),
+                            "-",
+                            "-",
+                            str(sol[i][0] - Rd),
+                            str(sol[i][1]),
+                        ]
+                    ),
+                    file=f,
+                )
+            with open(phase_ends_filename, "a+") as f:
+                print(
+                    ", ".join(
+                        [str(t[i] + phase_2_end), str(sol[i][0] - Rd), str(sol[i][1])]
+                    ),
+                    file=f,
+                )
+            break
+
+
+if __name__ == "__main__":
+    solve()
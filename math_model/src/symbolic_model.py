@@ -0,0 +1,105 @@
+import sympy
+from sympy.printing.pycode import PythonCodePrinter
+
+
+class SymbolicModel:
+    """ODE system, defined once symbolically and compiled to numeric RHS and Jacobian"""
+
+    def __init__(
+        self,
+        name: str,
+        state: list[sympy.Symbol],
+        time: sympy.Symbol,
+        equations: list[sympy.Expr],
+        parameters: list[sympy.Symbol],
+    ):
+        """
+        Public constructor
+
+        :param name: Name of the model
+        :param state: State variables of the system
+        :param time: Time variable
+        :param equations: Derivatives of the state variables, in the same order
+        :param parameters: Symbols, which values are passed at integration time
+        """
+        if len(state) != len(equations):
+            raise ValueError(
+                f"Model {name} has {len(state)} state variables, but {len(equations)} equations"
+            )
+
+        self.name = name
+        self.state = list(state)
+        self.time = time
+        self.equations = [sympy.sympify(equation) for equation in equations]
+        self.parameters = list(parameters)
+
+    @property
+    def jacobian_matrix(self) -> sympy.Matrix:
+        """
+        Symbolic Jacobian of the equations with respect to the state.
+
+        :return: Jacobian matrix
+        """
+        return sympy.Matrix(self.equations).jacobian(self.state)
+
+    def _generate_function(
+        self,
+        printer: PythonCodePrinter,
+        function_name: str,
+        expressions: list[sympy.Expr],
+    ) -> list[str]:
+        """
+        Generate source of a single function with common subexpressions eliminated.
+
+        :param printer: Printer for expressions
+        :param function_name: Name of the generated function
+        :param expressions: Expressions, that the function returns
+        :return: Lines of the source code
+        """
+        replacements, reduced = sympy.cse(
+            expressions, symbols=sympy.numbered_symbols("_cse"), optimizations="basic"
+        )
+        arguments = ", ".join(
+            ["u", printer.doprint(self.time)]
+            + [printer.doprint(p) for p in self.parameters]
+        )
+        unpacked = ", ".join(printer.doprint(s) for s in self.state)
+
+        lines = [f"def {function_name}({arguments}):", f"    [{unpacked}] = u"]
+        for symbol, expression in replacements:
+            lines.append(
+                f"    {printer.doprint(symbol)} = {printer.doprint(expression)}"
+            )
+
+        values = [printer.doprint(expression) for expression in reduced]
+        if function_name == "jacobian":
+            size = len(self.state)
+            rows = [", ".join(values[i * size : (i + 1) * size]) for i in range(size)]
+            lines.append("    return [" + ", ".join(f"[{row}]" for row in rows) + "]")
+        else:
+            lines.append("    return [" + ", ".join(values) + "]")
+
+        return lines
+
+    def generate_source(self) -> str:
+        """
+        Generate python module with parameter names, rhs and jacobian functions.
+
+        :return: Source code of the module
+        """
+        printer = PythonCodePrinter({"standard": "python3"})
+        parameters = ", ".join(repr(str(p)) for p in self.parameters)
+        lines = [
+            f"# Generated from model {self.name}, do not edit",
+            "import math",
+            "",
+            f"PARAMETERS = ({parameters},)",
+            "",
+            "",
+        ]
+        lines += self._generate_function(printer, "rhs", self.equations)
+        lines += ["", ""]
+        lines += self._generate_function(
+            printer, "jacobian", list(self.jacobian_matrix)
+        )
+        return "\n".join(lines) + "\n"